@@ -1,19 +1,27 @@
-from pbsm.utils import init_logger
+from pbsm.utils import configure_logging, init_logger
 from pbsm import connect
 from pbsm import bank_statement
+from pbsm import golden
 
 APP_NAME = "pbsm"
 lg = init_logger(APP_NAME)
 
 
 def main():
+    configure_logging(APP_NAME)
     bank_statement.main()
 
 
 def check_connection():
+    configure_logging(APP_NAME)
     nas_connection = connect.get_nas_path("NAS_ADDR01_SMB", "NAS_ADDR01_LOCAL")
     print(f"{nas_connection=}")
 
 
+def check_golden():
+    configure_logging(APP_NAME)
+    return golden.main()
+
+
 if __name__ == "__main__":
     main()
@@ -4,6 +4,7 @@ import shutil
 import datetime
 import math
 from pathlib import Path
+from typing import Iterable
 from dataclasses import dataclass
 from decimal import Decimal
 
@@ -78,6 +79,18 @@ class PdfStatement:
         self.statement_date = datetime.datetime.strptime(dt_str, "%d %b %Y")
         return self.statement_date.strftime("%Y%m%d")
 
+    def init_statement_date(
+        self, statement_date: datetime.datetime | None = None
+    ) -> str:
+        """
+        reads the statement date from the pdf header,
+        unless given (e.g. parsing text that was already extracted)
+        """
+        if statement_date is None:
+            return self.get_datetime_str(area=self.HEADER_AREA)
+        self.statement_date = statement_date
+        return self.statement_date.strftime("%Y%m%d")
+
     def get_statement_type(self) -> Stm:
         # Filename patter matching
         if fnmatch.fnmatch(self.filepath.name, "PDF文档*.pdf"):
@@ -112,29 +125,29 @@ class PdfStatement:
         archive_dir = parent_dir / self.prefix.value
         if not archive_dir.is_dir():
             archive_dir.mkdir()
-            lg.info(f"created {archive_dir=}")
+            lg.info("created archive_dir=%r", archive_dir)
         path_new = archive_dir / self.filepath.name
         old_filepath = self.filepath
         self.filepath = shutil.copy2(self.filepath, path_new)
         if self.filepath.is_file():
             os.remove(old_filepath)
-            lg.info(f"removed {old_filepath=}")
+            lg.info("removed old_filepath=%r", old_filepath)
 
     def rename_filename(self) -> None:
         dt_str = self.get_datetime_str(self.HEADER_AREA)
         new_name = f"{self.prefix.value}-{dt_str}{self.filepath.suffix}"
         self.filepath = self.filepath.rename(new_name)
-        lg.info(f"renamed to '{self.filepath.name}'")
+        lg.info("renamed to '%s'", self.filepath.name)
 
 
 class DbsCreditCardStatement(PdfStatement):
-    def __init__(self, filepath: Path):
+    def __init__(
+        self, filepath: Path, statement_date: datetime.datetime | None = None
+    ):
         super().__init__(filepath=filepath)
         self.HEADER_AREA = AREA_DBS_CC_HEADER
         self.prefix = Stm.DBS_CREDITCARD
-        self.statement_date_str = self.get_datetime_str(
-            area=self.HEADER_AREA
-        )  # run this to set dt_object
+        self.statement_date_str = self.init_statement_date(statement_date)
 
     def algorithm_text_to_data(self, txtlist: list[str]) -> pd.DataFrame:
         iter_txt = iter(txtlist)
@@ -152,7 +165,7 @@ class DbsCreditCardStatement(PdfStatement):
                 dt_obj = datetime.datetime.strptime(dt_str, "%d %b %Y")
                 txt = next(iter_txt)
             except Exception as e:
-                lg.warning(f"{e=}")
+                lg.warning("e=%r", e)
                 break
 
             descr = txt
@@ -173,7 +186,7 @@ class DbsCreditCardStatement(PdfStatement):
                 amt = Decimal(txt) * amt_type.value
                 txt = next(iter_txt)
             except Exception as e:
-                lg.warning(f"{e=}")
+                lg.warning("e=%r", e)
                 break
 
             datarows.append(
@@ -231,30 +244,38 @@ class DbsCreditCardStatement(PdfStatement):
 
 
 class DbsPaylahStatement(PdfStatement):
-    def __init__(self, filepath: Path):
+    def __init__(
+        self,
+        filepath: Path,
+        statement_date: datetime.datetime | None = None,
+        wallet_number: str = "",
+    ):
         super().__init__(filepath)
         self.HEADER_AREA = AREA_PAYLAH_HEADER
         self.prefix = Stm.DBS_PAYLAH
-        self.statement_date_str = self.get_datetime_str(
-            area=self.HEADER_AREA
-        )  # run this to set dt_object
-        self.WALLET_NUMBER = os.getenv("PAYLAH_WALLET_NUMBER", "")
+        self.statement_date_str = self.init_statement_date(statement_date)
+        self.WALLET_NUMBER = wallet_number or os.getenv("PAYLAH_WALLET_NUMBER", "")
         if not self.WALLET_NUMBER:
             raise EnvironmentError("missing 'PAYLAH_WALLET_NUMBER'")
 
-    def get_transaction_lines(self) -> list[str]:
+    def get_transaction_lines(
+        self, pages_text: Iterable[str] | None = None
+    ) -> list[str]:
         starter_line = f"PayLah! Wallet No. {self.WALLET_NUMBER}"
-        reader = PdfReader(self.filepath)
+        if pages_text is None:
+            reader = PdfReader(self.filepath)
+            pages_text = (pg.extract_text() for pg in reader.pages)
         header_page_line = (0, 0)
         is_useful_toggle = False  # switch to True, then append to useful_text
         is_transactions_end = False
         is_transactions_start = False
         trasactions_textlines = []
+        seen_pages = []
 
-        for pg_no, pg in enumerate(reader.pages):
+        for pg_no, text in enumerate(pages_text):
             if is_transactions_end:
                 break
-            text = pg.extract_text()
+            seen_pages.append(text)
             for line_no, line in enumerate(text.splitlines()):
                 if is_transactions_end:
                     break
@@ -276,15 +297,13 @@ class DbsPaylahStatement(PdfStatement):
                     trasactions_textlines.append(line)
                     continue
 
-        header = (
-            reader.pages[header_page_line[0]]
-            .extract_text()
-            .splitlines()[header_page_line[1]]
-        )
+        header = seen_pages[header_page_line[0]].splitlines()[header_page_line[1]]
         trasactions_textlines.insert(0, header)
         return trasactions_textlines
 
-    def algorithm_text_to_data(self) -> pd.DataFrame:
+    def algorithm_text_to_data(
+        self, textlist: list[str] | None = None
+    ) -> pd.DataFrame:
         """This algorithm is aborted because reference number varies in length
         # e.g. transaction number: 01689999990329103390492 4.50 CR
         # e.g. transaction number: 48985721688828929266 200.00 CR
@@ -292,10 +311,11 @@ class DbsPaylahStatement(PdfStatement):
         # e.g. transaction number: MB124510692040L54 200.00 CR
         """
 
-        textlist = self.get_transaction_lines()
+        if textlist is None:
+            textlist = self.get_transaction_lines()
 
         if len(textlist) == 1:
-            lg.warning(f"empty transactions detected in {self.filepath.name}")
+            lg.warning("empty transactions detected in %s", self.filepath.name)
             datarows = [
                 DataRow(
                     date=self.statement_date,
@@ -376,7 +396,7 @@ class DbsPaylahStatement(PdfStatement):
 
         return df
 
-    def algorithm_table_to_data(self):
+    def read_transaction_table(self) -> pd.DataFrame:
         reader = PdfReader(self.filepath)
         dflist = []
         is_last_page = False
@@ -408,13 +428,19 @@ class DbsPaylahStatement(PdfStatement):
             elif not series_findlast.empty:
                 is_last_page = True
                 last_row_index = series_findlast.index[-1]
-                # lg.debug(f"{last_row_index=}")
+                # lg.debug("last_row_index=%r", last_row_index)
                 df = df.iloc[:last_row_index, :]
                 dflist.append(df)
 
             break
 
-        df = pd.concat(dflist).reset_index(drop=True)
+        return pd.concat(dflist).reset_index(drop=True)
+
+    def algorithm_table_to_data(
+        self, df: pd.DataFrame | None = None
+    ) -> pd.DataFrame:
+        if df is None:
+            df = self.read_transaction_table()
 
         ## Remove errored dataframe due to empty transaction records
         if df[df.columns[1]].str.contains("INFORMATION ON YOUR DBS PAYLAH!").any():
@@ -429,7 +455,7 @@ class DbsPaylahStatement(PdfStatement):
         datarows = []
         dfiter = df.itertuples()
         while (row := next(dfiter, None)) is not None:
-            # print(f"{row._1=}, {row._2=}, {row._3=}")
+            lg.debug("row._1=%r, row._2=%r, row._3=%r", row._1, row._2, row._3)
             if not dt_obj:
                 datestr = f"{row._1} {self.statement_date.year}"
                 # dt_obj = datetime.datetime.strptime(datestr, "%d %b")
@@ -479,7 +505,7 @@ def main():
         for fp in pathfinder.get_pdf_files():
             statement = PdfStatement(filepath=fp)
             stm_type = statement.get_statement_type()
-            lg.info(f"Processing '{fp.stem}' using '{stm_type}' ...")
+            lg.info("Processing '%s' using '%s' ...", fp.stem, stm_type)
 
             match stm_type:
                 case Stm.DBS_PAYLAH:
@@ -491,19 +517,21 @@ def main():
                     df = statement.parse_transaction_to_dataframe()
                     dflist.append(df)
                 case _:
-                    lg.warning(f"{stm_type} not implemented yet")
+                    lg.warning("%s not implemented yet", stm_type)
 
             statement.post_process_sequence()
 
     except Exception as e:
-        lg.error(f"{e=}, {statement.filepath=}", exc_info=True)
+        lg.error("e=%r, statement.filepath=%r", e, statement.filepath, exc_info=True)
     finally:
         if dflist:
             df = pd.concat(dflist)
-            lg.info(df)
+            lg.info("compiled %d transactions from %d statements", len(df), len(dflist))
+            lg.debug("%s", df)
             df.to_excel("output-compiled.xlsx")
 
 
 if __name__ == "__main__":
     pd.set_option("display.max_rows", None)
+    utils.configure_logging(APP_NAME)
     main()
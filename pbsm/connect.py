@@ -51,11 +51,16 @@ def test_nas_connection():
     for smb_addr, local_addr in paths_db.items():
         local_path = Path(local_addr)
         if local_path.is_dir():
-            lg.info(f"already mounted - {local_path=}")
+            lg.info("already mounted - local_path=%r", local_path)
         else:
             command = f"osascript -e 'mount volume \"{smb_addr}\"'"
             returncode = os.system(command)
             if returncode == 0 and local_path.is_dir():
-                lg.info(f"mounted successfully - {local_path=}")
+                lg.info("mounted successfully - local_path=%r", local_path)
             else:
-                lg.error(f"mounting ({smb_addr} failed. {returncode=}, \n{command=})")
+                lg.error(
+                    "mounting (%s failed. returncode=%r, \ncommand=%r)",
+                    smb_addr,
+                    returncode,
+                    command,
+                )
@@ -0,0 +1,305 @@
+import io
+import sys
+import json
+import dataclasses
+import multiprocessing
+import math
+import random
+import datetime
+import time
+from pathlib import Path
+from decimal import Decimal
+
+import pandas as pd
+
+from pbsm import utils
+from pbsm.bank_statement import DataRow, DbsCreditCardStatement, DbsPaylahStatement
+
+APP_NAME = "pbsm"
+GOLDEN_FOLDERNAME = "golden"
+ANON_WALLET_NUMBER = "00000000"
+DATAROW_COLUMNS = [field.name for field in dataclasses.fields(DataRow)]
+
+# Minimum rows/second each parser must sustain on a generated statement
+# (best of THROUGHPUT_REPEATS after a warm-up run). Baseline measured with
+# `python -m pbsm.golden` on a developer's Linux x86_64 container (python 3.11,
+# pandas 2.x), 3 runs: paylah_table 27k-37k, paylah_text 31k-52k,
+# creditcard_text 32k-49k rows/s. The floors sit ~3-5x below the slowest run
+# to leave room for slower machines.
+THROUGHPUT_FLOORS = {
+    "paylah_table": 5_000,
+    "paylah_text": 10_000,
+    "creditcard_text": 10_000,
+}
+THROUGHPUT_ROWS = 2_000
+THROUGHPUT_REPEATS = 5
+
+lg = utils.init_logger(APP_NAME)
+
+
+def make_statement(case: dict) -> DbsPaylahStatement | DbsCreditCardStatement:
+    """create a statement from a golden case without touching any pdf file"""
+    filepath = Path(case["filename"])
+    statement_date = datetime.datetime.strptime(case["statement_date"], "%Y-%m-%d")
+    match case["parser"]:
+        case "paylah_table" | "paylah_text":
+            return DbsPaylahStatement(
+                filepath,
+                statement_date=statement_date,
+                wallet_number=case.get("wallet_number", ANON_WALLET_NUMBER),
+            )
+        case "creditcard_text":
+            return DbsCreditCardStatement(filepath, statement_date=statement_date)
+        case _:
+            raise ValueError(f"unknown parser {case['parser']=}")
+
+
+def run_parser(
+    case: dict, statement: DbsPaylahStatement | DbsCreditCardStatement | None = None
+) -> pd.DataFrame:
+    if statement is None:
+        statement = make_statement(case)
+    match case["parser"]:
+        case "paylah_table":
+            rows = [
+                [math.nan if v is None else v for v in row] for row in case["input"]
+            ]
+            return statement.algorithm_table_to_data(pd.DataFrame(rows))
+        case "paylah_text":
+            textlist = statement.get_transaction_lines(case["input"])
+            return statement.algorithm_text_to_data(textlist)
+        case _:
+            return statement.algorithm_text_to_data(case["input"])
+
+
+def serialize_value(key: str, value) -> str:
+    """format a parsed value into the same plain format as the golden files"""
+    if key == "date":
+        if not isinstance(value, datetime.datetime):
+            raise TypeError(f"expected a datetime, got {type(value).__name__}")
+        return value.strftime("%Y-%m-%d")
+    return str(value)
+
+
+def compare_dataframe(
+    df: pd.DataFrame, expected: list[dict[str, str]], columns: list[str]
+) -> list[str]:
+    mismatches = []
+    if list(df.columns) != columns:
+        mismatches.append(f"columns {list(df.columns)} != {columns}")
+
+    actual = []
+    for i, row in enumerate(df.to_dict("records")):
+        record = {}
+        for key, value in row.items():
+            try:
+                record[key] = serialize_value(key, value)
+            except (TypeError, ValueError, AttributeError) as e:
+                mismatches.append(f"row {i} {key}: cannot serialize {value!r} ({e})")
+                record[key] = None
+        actual.append(record)
+
+    if len(actual) != len(expected):
+        mismatches.append(f"row count {len(actual)=} != {len(expected)=}")
+    for i, (act, exp) in enumerate(zip(actual, expected)):
+        if missing := exp.keys() - act.keys():
+            mismatches.append(f"row {i} missing keys {sorted(missing)}")
+        if extra := act.keys() - exp.keys():
+            mismatches.append(f"row {i} unexpected keys {sorted(extra)}")
+        for key in exp.keys() & act.keys():
+            if act[key] != exp[key]:
+                mismatches.append(f"row {i} {key}: {act[key]!r} != {exp[key]!r}")
+    return mismatches
+
+
+def generate_case(parser: str, n_rows: int, seed: int = 0) -> dict:
+    """
+    generate an anonymized statement (parser input and expected rows)
+    covering both reference number lengths and multi-line descriptions
+    """
+    rng = random.Random(seed)
+    year = 2023
+    filename = f"generated-{parser}-{seed}.pdf"
+    merchants = ["MERCHANT A", "MERCHANT B PTE LTD", "TRANSFER TO WALLET"]
+
+    expected = []
+    raw = []
+    for i in range(n_rows):
+        dt = datetime.date(year, rng.randint(1, 12), rng.randint(1, 28))
+        # parser does not handle "1,234.00" (see also creditcard_text below)
+        cents = rng.randint(1, 99_999)
+        amount = Decimal(cents).scaleb(-2)
+        is_credit = rng.random() < 0.3
+        if rng.random() < 0.5:
+            ref_no = f"MB{rng.randrange(10**16):016d}L"  # 19 chars
+        else:
+            ref_no = f"{rng.randrange(10**23):023d}"  # 23 chars
+        descr = f"{rng.choice(merchants)} {i}"
+        raw.append((dt, descr, amount, is_credit, ref_no))
+
+    match parser:
+        case "paylah_table":
+            case_input = []
+            for dt, descr, amount, is_credit, ref_no in raw:
+                amt_type = "CR" if is_credit else "DB"
+                case_input.append([dt.strftime("%d %b"), descr, f"{amount} {amt_type}"])
+                case_input.append([None, f"REF NO:. {ref_no}", None])
+                expected.append((dt, descr, amount if is_credit else -amount, ref_no))
+
+        case "paylah_text":
+            lines = []
+            for dt, descr, amount, is_credit, ref_no in raw:
+                amt_type = "CR" if is_credit else "DB"
+                lines.append(f"{dt.strftime('%d %b')} {descr}")
+                lines.append(f"REF NO:. {ref_no}{amount} {amt_type}")
+                expected.append((dt, descr, amount if is_credit else -amount, ref_no))
+            case_input = [
+                "\n".join(
+                    [
+                        "Statement Header",
+                        f"PayLah! Wallet No. {ANON_WALLET_NUMBER}",
+                        "NEW TRANSACTIONS",
+                        *lines,
+                        "Total :",
+                    ]
+                )
+            ]
+
+        case "creditcard_text":
+            case_input = ["NEW TRANSACTIONS"]
+            for dt, descr, amount, is_credit, _ in raw:
+                if is_credit and amount < 10:
+                    # parser checks txt[:5], so "0.79 CR" includes the space
+                    # and is read as a 2nd description line (see golden case)
+                    amount += 10
+                case_input.append(dt.strftime("%d %b").upper())
+                if rng.random() < 0.3:
+                    case_input.extend([descr, "SINGAPORE SG"])
+                    descr += "SINGAPORE SG"
+                else:
+                    case_input.append(descr)
+                case_input.append(f"{amount} CR" if is_credit else f"{amount}")
+                expected.append((dt, descr, amount if is_credit else -amount, ""))
+            case_input.append("SUB-TOTAL:")
+
+        case _:
+            raise ValueError(f"unknown {parser=}")
+
+    return {
+        "parser": parser,
+        "statement_date": f"{year}-12-31",
+        "filename": filename,
+        "input": case_input,
+        "expected": [
+            {
+                "date": dt.strftime("%Y-%m-%d"),
+                "descr": descr,
+                "amount": str(amount),
+                "reference_number": ref_no,
+                "reference_filename": filename,
+            }
+            for dt, descr, amount, ref_no in expected
+        ],
+    }
+
+
+def load_corpus(corpus_dir: Path | None = None) -> dict[str, dict]:
+    if corpus_dir is None:
+        corpus_dir = utils.PathFinder().get_resources_dir() / GOLDEN_FOLDERNAME
+    if not corpus_dir.is_dir():
+        raise NotADirectoryError(f"{corpus_dir=}")
+    return {
+        fp.name: json.loads(fp.read_text(encoding="utf-8"))
+        for fp in sorted(corpus_dir.glob("*.json"))
+    }
+
+
+def check_parsed(
+    name: str, df: pd.DataFrame, expected: list[dict], columns: list[str]
+) -> bool:
+    mismatches = compare_dataframe(df, expected, columns)
+    for msg in mismatches:
+        lg.error("%s: %s", name, msg)
+    return not mismatches
+
+
+def check_case(name: str, case: dict) -> bool:
+    try:
+        df = run_parser(case)
+    except Exception as e:
+        lg.error("%s: parser raised e=%r", name, e, exc_info=True)
+        return False
+    return check_parsed(
+        name, df, case["expected"], case.get("columns", DATAROW_COLUMNS)
+    )
+
+
+def check_throughput(parser: str, n_rows: int = THROUGHPUT_ROWS) -> bool:
+    name = f"generated-{parser}"
+    case = generate_case(parser, n_rows=n_rows, seed=n_rows)
+    try:
+        statement = make_statement(case)
+        df = run_parser(case, statement)  # warm-up run, also checked for correctness
+        if not check_parsed(name, df, case["expected"], DATAROW_COLUMNS):
+            return False
+        elapsed = math.inf
+        for _ in range(THROUGHPUT_REPEATS):
+            t0 = time.perf_counter()
+            run_parser(case, statement)
+            elapsed = min(elapsed, time.perf_counter() - t0)
+    except Exception as e:
+        lg.error("%s: parser raised e=%r", name, e, exc_info=True)
+        return False
+    rate = len(df) / elapsed if elapsed else math.inf
+    floor = THROUGHPUT_FLOORS[parser]
+    if rate < floor:
+        lg.error("%s: %.0f rows/s is below floor of %d rows/s", parser, rate, floor)
+        return False
+    lg.info("%s: %.0f rows/s (floor %d rows/s)", parser, rate, floor)
+    return True
+
+
+def _log_error_in_forked_worker() -> None:
+    sys.stderr = io.StringIO()
+    lg.error("error from forked worker")
+    output = sys.stderr.getvalue()
+    sys.stderr = sys.__stderr__
+    sys.exit(0 if "error from forked worker" in output else 1)
+
+
+def check_logging_after_fork() -> bool:
+    """a forked worker that never calls configure_logging still shows errors"""
+    if "fork" not in multiprocessing.get_all_start_methods():
+        return True
+    ctx = multiprocessing.get_context("fork")
+    worker = ctx.Process(target=_log_error_in_forked_worker)
+    worker.start()
+    worker.join(timeout=30)
+    if worker.exitcode != 0:
+        lg.error("logging after fork: error record lost (%r)", worker.exitcode)
+        return False
+    lg.info("logging after fork: ok")
+    return True
+
+
+def main(corpus_dir: Path | None = None) -> int:
+    failed = []
+    for name, case in load_corpus(corpus_dir).items():
+        if check_case(name, case):
+            lg.info("%s: ok", name)
+        else:
+            failed.append(name)
+    for parser in THROUGHPUT_FLOORS:
+        if not check_throughput(parser):
+            failed.append(parser)
+    if not check_logging_after_fork():
+        failed.append("logging_after_fork")
+    if failed:
+        lg.error("golden corpus check failed - failed=%r", failed)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    utils.configure_logging(APP_NAME)
+    sys.exit(main())
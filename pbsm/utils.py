@@ -1,8 +1,20 @@
 import logging
+import os
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from multiprocessing.util import Finalize
 from pathlib import Path
 
 
 APP_NAME = "pbsm"
+LOG_MAX_BYTES = 5 * 1024 * 1024
+LOG_BACKUP_COUNT = 3
+DEBUG_SAMPLE_EVERY = 100
+
+_log_listener: QueueListener | None = None
+_log_handler: QueueHandler | None = None
+_log_pid: int | None = None
+_log_settings: tuple = ()
 
 
 class NonePath:
@@ -57,32 +69,122 @@ class PathFinder:
         return fp
 
 
+class SampledDebugFilter(logging.Filter):
+    """
+    lets through every n-th DEBUG record of each call site
+    (per-row diagnostics), records of other levels always pass
+    """
+
+    def __init__(self, every: int = DEBUG_SAMPLE_EVERY):
+        super().__init__()
+        self.every = max(1, every)
+        self._counts: dict[tuple[str, int], int] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno != logging.DEBUG:
+            return True
+        key = (record.pathname, record.lineno)
+        count = self._counts.get(key, 0)
+        self._counts[key] = count + 1
+        return count % self.every == 0
+
+
 def init_logger(name: str = "") -> logging.Logger:
     """
-    initialize an logger (console output and file output)
-    returns existing logger if already initialized before
+    returns the named logger without attaching any handler,
+    handlers are set up once per process by configure_logging()
     """
     logger_name = name if name else __name__
-    logger = logging.getLogger(logger_name)
-    if logger.hasHandlers():
+    return logging.getLogger(logger_name)
+
+
+def _reset_logging_after_fork() -> None:
+    """
+    drop the QueueHandler inherited from a parent process (nothing drains its
+    queue in the child), so an unconfigured worker falls back to
+    logging.lastResort (WARNING and above to stderr) instead of losing records
+    """
+    global _log_listener, _log_handler, _log_pid, _log_settings
+    if _log_handler is None or _log_pid == os.getpid():
+        return
+    logging.getLogger(_log_settings[0]).removeHandler(_log_handler)
+    _log_listener = None
+    _log_handler = None
+    _log_pid = None
+    _log_settings = ()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_logging_after_fork)
+
+
+def configure_logging(
+    name: str = APP_NAME,
+    level: int = logging.INFO,
+    log_dir: Path | None = None,
+    worker_id: str | int | None = None,
+    debug_sample_every: int = DEBUG_SAMPLE_EVERY,
+) -> logging.Logger:
+    """
+    configure the application logger (console output and rotating file output)
+    records are passed through a queue to a background listener thread,
+    so logging calls do not block on console or file io
+    worker processes should pass a worker_id to write to their own log file
+    returns existing logger if already configured before in this process,
+    a forked worker drops the queue inherited from its parent (also without
+    calling this, see _reset_logging_after_fork) and sets up its own
+    """
+    global _log_listener, _log_handler, _log_pid, _log_settings
+    logger = logging.getLogger(name)
+    settings = (name, level, log_dir, worker_id, debug_sample_every)
+    if _log_listener is not None and _log_pid == os.getpid():
+        if settings != _log_settings:
+            logger.warning(
+                "logging already configured with %r, ignoring %r",
+                _log_settings,
+                settings,
+            )
         return logger
+    _reset_logging_after_fork()
+
     c_handler = logging.StreamHandler()
     c_format = logging.Formatter("%(levelname)-8s: %(message)s")
     c_handler.setFormatter(c_format)
-    c_handler.setLevel(logging.INFO)
-    logger.addHandler(c_handler)
-    logger_filename = (
-        f"{logger_name}.log" if logger_name != "__main__" else f"{name}.log"
+    c_handler.setLevel(level)
+
+    log_dir = Path.cwd() if log_dir is None else log_dir
+    logger_filename = f"{name}.log" if worker_id is None else f"{name}-{worker_id}.log"
+    f_handler = RotatingFileHandler(
+        log_dir / logger_filename,
+        maxBytes=LOG_MAX_BYTES,
+        backupCount=LOG_BACKUP_COUNT,
+        encoding="utf-8",
+        delay=True,
     )
-    f_handler = logging.FileHandler(logger_filename)
     f_format = logging.Formatter(
         "[%(asctime)s]%(levelname)-8s: %(message)s", "%d-%b-%y %H:%M"
     )
     f_handler.setFormatter(f_format)
-    f_handler.setLevel(logging.INFO)
-    logger.addHandler(f_handler)
-    logger.setLevel(logging.INFO)
-    logger.info(f"logger initialized - {logger_filename}")
+    f_handler.setLevel(level)
+
+    log_queue = queue.SimpleQueue()
+    q_handler = QueueHandler(log_queue)
+    q_handler.addFilter(SampledDebugFilter(debug_sample_every))
+    logger.addHandler(q_handler)
+    logger.setLevel(level)
+    logger.propagate = False
+
+    _log_listener = QueueListener(
+        log_queue, c_handler, f_handler, respect_handler_level=True
+    )
+    _log_listener.start()
+    _log_handler = q_handler
+    _log_pid = os.getpid()
+    _log_settings = settings
+    # runs at interpreter exit and at the end of multiprocessing workers
+    # (which skip atexit), only in the process that created the listener
+    Finalize(_log_listener, _log_listener.stop, exitpriority=0)
+    logger.debug("logger configured - %s", f_handler.baseFilename)
     return logger
 
 